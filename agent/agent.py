@@ -2,7 +2,7 @@ import re
 
 from langchain_openai import ChatOpenAI
 
-from .tools import run_athena_query
+from .tools import run_athena_queries_first, run_athena_query
 from .config import (
     ATHENA_DATABASE,
     MAX_SQL_RETRIES,
@@ -10,9 +10,13 @@ from .config import (
     SCHEMA_ENRICHMENT,
     SCHEMA_ENRICHMENT_COLUMNS,
     SCHEMA_ENRICHMENT_MAX_VALUES,
+    SPECULATIVE_SQL,
+    SPECULATIVE_SQL_CANDIDATES,
 )
 from .prompts import (
     SCHEMA_DESCRIPTION,
+    SINGLE_SQL_OUTPUT,
+    SQL_CANDIDATES_OUTPUT,
     SQL_GENERATION_PROMPT,
     SQL_GENERATION_RETRY_PROMPT,
     SUMMARIZE_RESULTS_PROMPT,
@@ -57,6 +61,109 @@ def _extract_sql(text: str) -> str:
     return t
 
 
+# Keywords that may directly precede a SELECT inside one statement (e.g. UNION ALL SELECT ...)
+_SET_OPERATORS = ("union", "intersect", "except", "all", "distinct")
+_SQL_TOKEN = re.compile(r"'|\"|[();]|[a-z_][a-z0-9_]*", re.IGNORECASE)
+
+
+def _split_sql_candidates(text: str) -> list[str]:
+    """
+    Split LLM output into candidate query texts. Boundaries: each markdown code block (when the
+    output has fences, text outside them is ignored), lines of ---, semicolons outside string literals,
+    and a new top-level SELECT at the start of a line (after an optional "1." / "1)" list marker).
+    Only parts containing exactly one top-level SELECT are returned.
+    """
+    lines = text.splitlines()
+    fenced = any(re.match(r"^\s*```", line) for line in lines)
+    parts = []
+    current = ""
+    quote = None
+    depth = 0
+    selects = 0
+    prev_word = ""
+    in_fence = False
+
+    def flush():
+        nonlocal current, quote, depth, selects, prev_word
+        if selects == 1:
+            parts.append(current)
+        current, quote, depth, selects, prev_word = "", None, 0, 0, ""
+
+    for line in lines:
+        if re.match(r"^\s*```", line):
+            in_fence = not in_fence
+            flush()
+            continue
+        if fenced and not in_fence:
+            continue
+        if quote is None and depth == 0:
+            if re.match(r"^\s*-{3,}\s*$", line):
+                flush()
+                continue
+            marker = re.match(r"^\s*(?:\d+[.)]\s*)?(?=select\b)", line, re.IGNORECASE)
+            if marker:
+                if selects and prev_word not in _SET_OPERATORS:
+                    flush()
+                line = line[marker.end() :]
+        start = 0
+        for tok in _SQL_TOKEN.finditer(line):
+            t = tok.group()
+            if quote is not None:
+                if t == quote:
+                    quote = None
+                continue
+            # Ignore prose (and its apostrophes) before the query starts
+            if not selects and t.lower() != "select":
+                continue
+            if t in ("'", '"'):
+                quote = t
+            elif t == "(":
+                depth += 1
+            elif t == ")":
+                depth = max(0, depth - 1)
+            elif t == ";":
+                if depth == 0:
+                    current += line[start : tok.start()]
+                    flush()
+                    start = tok.end()
+            else:
+                word = t.lower()
+                if word == "select" and depth == 0 and prev_word not in _SET_OPERATORS:
+                    selects += 1
+                prev_word = word
+        current += line[start:] + "\n"
+    flush()
+    return parts
+
+
+def _extract_sql_candidates(text: str) -> list[str]:
+    """
+    Extract the distinct SELECT statements from LLM output containing several candidates
+    (see _split_sql_candidates); duplicates (ignoring case and whitespace) are kept once.
+    """
+    candidates = []
+    seen = set()
+    for part in _split_sql_candidates(text):
+        start = re.search(r"\bselect\b", part, re.IGNORECASE)
+        if not start:
+            continue
+        sql = part[start.start() :].strip()
+        key = " ".join(sql.lower().split())
+        if key not in seen:
+            seen.add(key)
+            candidates.append(sql)
+    if not candidates:
+        raise ValueError("No SELECT statement found in model output.")
+    return candidates[:SPECULATIVE_SQL_CANDIDATES]
+
+
+def _get_sql_output_wording() -> dict[str, str]:
+    """Return the prompt wording for one query, or for N candidates when speculative mode is on."""
+    if not SPECULATIVE_SQL:
+        return SINGLE_SQL_OUTPUT
+    return {key: text.format(n=SPECULATIVE_SQL_CANDIDATES) for key, text in SQL_CANDIDATES_OUTPUT.items()}
+
+
 def _format_rows_for_prompt(rows: list) -> str:
     """Format Athena result rows as a string for the LLM."""
     if not rows:
@@ -65,14 +172,8 @@ def _format_rows_for_prompt(rows: list) -> str:
 
 
 def _is_zero_data_rows(rows: list) -> bool:
-    """True when Athena returned 0 data rows (empty list or only header row)."""
-    if len(rows) == 0:
-        return True
-    if len(rows) == 1 and rows[0].get("Data"):
-        first_cell = (rows[0]["Data"][0] or {}).get("VarCharValue", "")
-        if first_cell == "ticket_id":
-            return True
-    return False
+    """True when Athena returned 0 data rows (empty list or only the header row, which SELECT results always include)."""
+    return len(rows) <= 1
 
 
 def _parse_distinct_rows(rows: list, column_name: str) -> list[str]:
@@ -143,11 +244,16 @@ def ask_agent(
     conversation_history: list of (user_question, agent_summary) for the last N turns (enables follow-up questions).
     return_sql: if True, return a dict with summary and sql so the caller can print SQL for manual verification.
     Guardrails: read-only queries only; schema constraint (allowed table(s) only).
+    When SPECULATIVE_SQL is on, each attempt asks for SPECULATIVE_SQL_CANDIDATES queries in one LLM call and runs
+    the valid distinct ones concurrently on Athena; the first non-empty result wins and the rest are cancelled.
     """
     conversation_context = _format_conversation_context(conversation_history or [])
     schema = _get_enriched_schema()
+    output_wording = _get_sql_output_wording()
     sql = None
+    previous_sql = None
     last_error = None
+    candidate_errors: list[str] = []
     for attempt in range(MAX_SQL_RETRIES):
         try:
             if attempt == 0:
@@ -156,6 +262,7 @@ def ask_agent(
                     database=ATHENA_DATABASE,
                     question=question,
                     conversation_context=conversation_context,
+                    **output_wording,
                 )
             else:
                 prompt = SQL_GENERATION_RETRY_PROMPT.format(
@@ -163,18 +270,30 @@ def ask_agent(
                     database=ATHENA_DATABASE,
                     question=question,
                     conversation_context=conversation_context,
-                    previous_sql=sql or "(none)",
+                    previous_sql=previous_sql or "(none)",
                     error=last_error or "(unknown)",
+                    **output_wording,
                 )
             raw_sql = llm.invoke(prompt).content
-            sql = _extract_sql(raw_sql)
-            rows = run_athena_query(sql)
+            if SPECULATIVE_SQL:
+                candidates = _extract_sql_candidates(raw_sql)
+                # Show the whole candidate set as "Previous SQL" if this attempt fails or returns 0 rows
+                previous_sql = "\n---\n".join(candidates)
+                sql, rows, candidate_errors = run_athena_queries_first(
+                    candidates, accept=lambda r: not _is_zero_data_rows(r)
+                )
+            else:
+                sql = _extract_sql(raw_sql)
+                previous_sql = sql
+                rows = run_athena_query(sql)
             # Retry when query succeeded but returned 0 data rows (empty or only Athena header row)
             if RETRY_ON_ZERO_ROWS and _is_zero_data_rows(rows) and attempt < MAX_SQL_RETRIES - 1:
                 last_error = (
                     "Query succeeded but returned 0 rows. Consider using LIKE 'value%' for text columns "
                     "(e.g. category LIKE 'IT%') instead of exact = 'value', or check that filter values match the data."
                 )
+                if candidate_errors:
+                    last_error += " Other candidates failed: " + " | ".join(candidate_errors)
                 continue
             break
         except (ValueError, RuntimeError) as e:
@@ -16,6 +16,12 @@ CONVERSATION_HISTORY_SIZE = int(os.environ.get("CONVERSATION_HISTORY_SIZE", "2")
 # Agent: when True, retry SQL generation if the query succeeds but returns 0 rows (suggests wrong filter, e.g. exact match instead of LIKE)
 RETRY_ON_ZERO_ROWS = os.environ.get("RETRY_ON_ZERO_ROWS", "true").strip().lower() in ("true", "1", "yes")
 
+# Speculative SQL: ask the LLM for N candidate queries per attempt, run the valid distinct ones concurrently on Athena,
+# keep the first non-empty result and cancel the rest (cuts latency on questions that would otherwise need several retries)
+SPECULATIVE_SQL = os.environ.get("SPECULATIVE_SQL", "false").strip().lower() in ("true", "1", "yes")
+# At least 2: a single candidate is just the sequential path (and would make the candidates prompt contradictory)
+SPECULATIVE_SQL_CANDIDATES = max(2, int(os.environ.get("SPECULATIVE_SQL_CANDIDATES", "3")))
+
 # Schema enrichment: fetch distinct values for these columns from Athena and add to prompt (so LLM uses exact names)
 SCHEMA_ENRICHMENT = os.environ.get("SCHEMA_ENRICHMENT", "true").strip().lower() in ("true", "1", "yes")
 SCHEMA_ENRICHMENT_COLUMNS = [
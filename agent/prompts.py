@@ -20,13 +20,13 @@ Terminology: In this dataset, "IT tickets" means tickets assigned to IT (filter
 When sample values are provided below, prefer exact values from that list in filters. If no sample values are given, use LIKE 'term%%' for short terms.
 """
 
-SQL_GENERATION_PROMPT = """You generate a single read-only SQL (SELECT) query for Amazon Athena.
+SQL_GENERATION_PROMPT = """You generate {query_task} for Amazon Athena.
 
 {schema}
 
 Rules:
 - Use only the table and columns above. Table name: tickets (or {database}.tickets).
-- Return only the SQL query, no explanation. No markdown, no code block wrapper.
+- {output_instruction}
 - Use valid Athena SQL (e.g. no semicolon required).
 - "IT tickets" means tickets assigned to IT: filter on assigned_to (e.g. assigned_to = 'IT Services' or assigned_to LIKE 'IT%%'), not on category.
 - For other text filters: use exact values from the sample list when provided, or LIKE 'value%%' for short terms; use exact = when the exact value is known.
@@ -39,13 +39,13 @@ Current user question: {question}
 """
 
 # Used when a previous SQL attempt failed (guardrail or Athena error); ask for a corrected query
-SQL_GENERATION_RETRY_PROMPT = """You generate a single read-only SQL (SELECT) query for Amazon Athena.
+SQL_GENERATION_RETRY_PROMPT = """You generate {query_task} for Amazon Athena.
 
 {schema}
 
 Rules:
 - Use only the table and columns above. Table name: tickets (or {database}.tickets).
-- Return only the SQL query, no explanation. No markdown, no code block wrapper.
+- {output_instruction}
 - Use valid Athena SQL (e.g. no semicolon required).
 
 The previous attempt failed. Fix the query based on the error below.
@@ -61,9 +61,25 @@ Previous SQL (failed):
 Error from system:
 {error}
 
-If the error says "returned 0 rows", check the filter: "IT tickets" means assigned_to (e.g. assigned_to = 'IT Services'), not category. Use LIKE 'value%%' or exact values from the sample list as needed. Generate a corrected SQL query only.
+If the error says "returned 0 rows", check the filter: "IT tickets" means assigned_to (e.g. assigned_to = 'IT Services'), not category. Use LIKE 'value%%' or exact values from the sample list as needed. Generate {corrected_output} only.
 """
 
+# Output wording for the SQL generation prompts: one query (default) or several candidates (speculative mode)
+SINGLE_SQL_OUTPUT = {
+    "query_task": "a single read-only SQL (SELECT) query",
+    "output_instruction": "Return only the SQL query, no explanation. No markdown, no code block wrapper.",
+    "corrected_output": "a corrected SQL query",
+}
+SQL_CANDIDATES_OUTPUT = {
+    "query_task": "{n} different candidate read-only SQL (SELECT) queries",
+    "output_instruction": (
+        "Return {n} different candidate SQL queries that each answer the question, trying different plausible "
+        "interpretations or filters (e.g. exact value vs LIKE 'value%', assigned_to vs category). "
+        "Separate the candidates with a line containing only ---. No explanation. No markdown, no code block wrapper."
+    ),
+    "corrected_output": "{n} corrected candidate SQL queries",
+}
+
 SUMMARIZE_RESULTS_PROMPT = """The user asked: "{question}"
 
 Here are the query results (raw rows):
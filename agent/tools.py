@@ -1,6 +1,9 @@
 import boto3
 import re
 import time
+from typing import Callable
+
+from botocore.exceptions import ClientError
 
 from .config import ATHENA_DATABASE, ATHENA_OUTPUT, ALLOWED_TABLE_REFS
 
@@ -33,13 +36,13 @@ _READONLY_FORBIDDEN = (
     "replace", "merge", "grant", "revoke",
 )
 
+_TERMINAL_STATES = ("SUCCEEDED", "FAILED", "CANCELLED")
 
-def run_athena_query(query: str) -> list:
+
+def _validate_readonly_query(query: str) -> None:
     """
-    Executes a read-only Athena query and returns the result rows.
-    Guardrails:
-    - SELECT queries only (and no write/DDL keywords elsewhere)
-    - Only allowed table(s) may be referenced (schema constraint)
+    Applies the read-only and schema guardrails to a query.
+    Raises ValueError if the query is not allowed.
     """
     q = query.strip()
     if not q.lower().startswith("select"):
@@ -50,21 +53,46 @@ def run_athena_query(query: str) -> list:
             raise ValueError(f"Read-only guardrail: keyword '{kw}' is not allowed.")
     _validate_schema_constraint(q)
 
+
+def _start_query(query: str) -> str:
+    """Starts an Athena query execution and returns its execution id."""
     response = client.start_query_execution(
         QueryString=query,
         QueryExecutionContext={"Database": ATHENA_DATABASE},
         ResultConfiguration={"OutputLocation": ATHENA_OUTPUT},
     )
+    return response["QueryExecutionId"]
+
+
+def _get_query_state(execution_id: str) -> str:
+    """Returns the current Athena state (QUEUED, RUNNING, SUCCEEDED, FAILED, CANCELLED)."""
+    return client.get_query_execution(
+        QueryExecutionId=execution_id
+    )["QueryExecution"]["Status"]["State"]
+
+
+def _get_query_rows(execution_id: str) -> list:
+    """Returns the result rows of a succeeded Athena query."""
+    results = client.get_query_results(QueryExecutionId=execution_id)
+    return results["ResultSet"]["Rows"]
 
-    execution_id = response["QueryExecutionId"]
+
+def run_athena_query(query: str) -> list:
+    """
+    Executes a read-only Athena query and returns the result rows.
+    Guardrails:
+    - SELECT queries only (and no write/DDL keywords elsewhere)
+    - Only allowed table(s) may be referenced (schema constraint)
+    """
+    _validate_readonly_query(query)
+
+    execution_id = _start_query(query)
 
     # Wait for completion
     while True:
-        status = client.get_query_execution(
-            QueryExecutionId=execution_id
-        )["QueryExecution"]["Status"]["State"]
+        status = _get_query_state(execution_id)
 
-        if status in ["SUCCEEDED", "FAILED", "CANCELLED"]:
+        if status in _TERMINAL_STATES:
             break
 
         time.sleep(1)
@@ -72,6 +100,69 @@ def run_athena_query(query: str) -> list:
     if status != "SUCCEEDED":
         raise RuntimeError(f"Athena query failed: {status}")
 
-    results = client.get_query_results(QueryExecutionId=execution_id)
-    return results["ResultSet"]["Rows"]
+    return _get_query_rows(execution_id)
 
+
+def run_athena_queries_first(
+    queries: list[str],
+    accept: Callable[[list], bool] | None = None,
+) -> tuple[str, list, list[str]]:
+    """
+    Executes several candidate read-only queries concurrently on Athena and returns
+    (query, rows, errors) for the first one that succeeds with rows accepted by `accept`;
+    errors lists the candidates that failed (guardrail or Athena error) before the result was chosen.
+    The remaining executions are cancelled via stop_query_execution.
+    Candidates failing the guardrails are skipped locally and never sent to Athena.
+    If no result is accepted, falls back to the first succeeded query (in candidate order).
+    Raises ValueError if no candidate passes the guardrails, RuntimeError if none can be started
+    or all executions fail.
+    """
+    errors = []
+    valid = []
+    for query in queries:
+        try:
+            _validate_readonly_query(query)
+        except ValueError as e:
+            errors.append(f"{query!r}: {e}")
+            continue
+        valid.append(query)
+    if not valid:
+        raise ValueError("No candidate query passed the guardrails. " + " | ".join(errors))
+
+    running: dict[str, str] = {}
+    succeeded: dict[str, list] = {}
+    try:
+        for query in valid:
+            # Starting N queries at once can hit throttling; record it like a failed execution
+            try:
+                running[_start_query(query)] = query
+            except ClientError as e:
+                errors.append(f"{query!r}: Athena query could not start: {e}")
+        if not running:
+            raise RuntimeError("No candidate query could be started. " + " | ".join(errors))
+        while running:
+            for execution_id, query in list(running.items()):
+                status = _get_query_state(execution_id)
+                if status not in _TERMINAL_STATES:
+                    continue
+                del running[execution_id]
+                if status != "SUCCEEDED":
+                    errors.append(f"{query!r}: Athena query failed: {status}")
+                    continue
+                rows = _get_query_rows(execution_id)
+                if accept is None or accept(rows):
+                    return query, rows, errors
+                succeeded[query] = rows
+            if running:
+                time.sleep(1)
+    finally:
+        for execution_id in running:
+            try:
+                client.stop_query_execution(QueryExecutionId=execution_id)
+            except ClientError:
+                pass
+
+    for query in valid:
+        if query in succeeded:
+            return query, succeeded[query], errors
+    raise RuntimeError("All candidate queries failed. " + " | ".join(errors))